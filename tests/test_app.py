@@ -0,0 +1,122 @@
+import os
+import queue
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent import futures
+
+import openpyxl
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+
+def _cells(path, sheet):
+    """Return every row of `sheet` as a list of raw cell values."""
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return [list(row) for row in wb[sheet].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+class SaveDataTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "members.xlsx")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_points_next_to_mixed_column(self):
+        members = pd.DataFrame({
+            "StudentID": pd.Series(["1001", "1002"], dtype="string[pyarrow]"),
+            "Name": pd.Series(["Ana", "Ben"], dtype="string[pyarrow]"),
+            "Points": pd.array([5, None], dtype="Int32"),
+            "Note": pd.Series([3, "late"], dtype=object),
+        })
+        app.save_data({"members": members}, self.path)
+        rows = _cells(self.path, "members")
+        self.assertEqual(rows[0], ["StudentID", "Name", "Points", "Note"])
+        self.assertEqual(rows[2][1:], ["Ben", None, "late"])
+        self.assertEqual(rows[1][2], 5)
+
+
+class StudentIdRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "members.xlsx")
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "members"
+        for row in (["StudentID", "Name", "Points"], [1001, "Ana", 5], [None, "Ben", 3], [1003, "Cy", 1]):
+            ws.append(row)
+        att = wb.create_sheet("event_attendance")
+        for row in (["Event", "StudentID"], ["Mass", 1001], ["Mass", "A-7"]):
+            att.append(row)
+        wb.save(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ids_load_without_float_suffix(self):
+        data = app.load_data(self.path)
+        self.assertEqual(list(data["members"]["StudentID"].dropna()), ["1001", "1003"])
+        self.assertEqual(list(data["event_attendance"]["StudentID"]), ["1001", "A-7"])
+
+    def test_numeric_ids_are_written_as_numbers(self):
+        app.save_data(dict(app.load_data(self.path)), self.path)
+        self.assertEqual([r[0] for r in _cells(self.path, "members")], ["StudentID", 1001, None, 1003])
+        self.assertEqual(_cells(self.path, "event_attendance")[1:], [["Mass", 1001], ["Mass", "A-7"]])
+
+
+class LoadDataTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "members.xlsx")
+        members = pd.DataFrame({"StudentID": ["1001"], "Name": ["Ana"], "Points": [120]})
+        app.save_data({"members": members}, self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_parse_cached_before_a_save_lands_is_not_reused(self):
+        # another session reruns while the save is still queued and caches the old file
+        stale = app.load_data(self.path)
+        saved = dict(stale)
+        saved["members"] = stale["members"].assign(Points=170)
+        app.save_data(saved, self.path)
+        self.assertEqual(int(app.load_data(self.path)["members"].at[0, "Points"]), 170)
+
+
+class SaveWorkerTest(unittest.TestCase):
+    def test_last_job_per_path_runs_and_shares_its_outcome(self):
+        ran = []
+
+        def job(tag, fail=False):
+            def write():
+                ran.append(tag)
+                if fail:
+                    raise OSError(tag)
+            return write
+
+        state = {"queue": queue.Queue()}
+        jobs = [("a", job("a1")), ("b", job("b1", fail=True)), ("a", job("a2"))]
+        waits = [futures.Future() for _ in jobs]
+        # queued before the worker starts, so one pass takes them all
+        for (path, write), future in zip(jobs, waits):
+            state["queue"].put((path, write, future))
+        threading.Thread(target=app._save_worker, args=(state,), daemon=True).start()
+        futures.wait(waits, timeout=5)
+
+        self.assertEqual(ran, ["b1", "a2"])
+        self.assertIsNone(waits[0].exception())
+        self.assertIsNone(waits[2].exception())
+        self.assertIsInstance(waits[1].exception(), OSError)
+
+
+if __name__ == "__main__":
+    unittest.main()